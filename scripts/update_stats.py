@@ -7,36 +7,345 @@ and outputs them to docs/stats.json for visualization.
 
 Requirements:
     - Python 3.8+
-    - requests library
+    - requests library (with urllib3 1.26+)
+    - orjson library (optional, faster JSON parsing/serialization)
+    - numpy library (optional, faster monthly aggregation)
     - GITHUB_TOKEN environment variable for API access
 
 Usage:
-    python scripts/update_stats.py [--folder FOLDER] [--repo-owner OWNER --repo-name NAME]
+    python scripts/update_stats.py [--folder FOLDER] [--repo-owner OWNER --repo-name NAME] [--remote REMOTE]
+                                   [--pretty] [--split-templates] [--verbose]
 
     Options:
         --folder FOLDER      Path to templates repository folder (default: 'Templates')
         --repo-owner OWNER   GitHub repository owner
         --repo-name NAME     GitHub repository name
         --remote REMOTE      Git remote name for auto-detection
+        --pretty             Write indented stats.json (default: compact)
+        --split-templates    Write the per-template list to docs/templates.json instead of embedding it
+        --verbose            Log debug output (pagination and reviewer progress)
 """
 
 import argparse
+import functools
+import hashlib
+import heapq
 import json
+import logging
 import os
 import subprocess
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from itertools import accumulate
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import re
+from urllib.parse import parse_qs, urlparse
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: 'requests' library not found. Install with: pip install requests")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# GitHub remote URL, both HTTPS and SSH formats:
+# https://github.com/owner/repo.git or git@github.com:owner/repo.git
+_GITHUB_REMOTE_RE = re.compile(r'github\.com[:/]([^/]+)/([^/]+?)(?:\.git)?$')
+
+# All PRs with their changed files and reviews, one page per request.
+# Ordered like the REST walk (most recently updated first).
+_PULL_REQUESTS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 50, after: $cursor, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number
+        title
+        state
+        createdAt
+        updatedAt
+        mergedAt
+        url
+        author { login avatarUrl url }
+        labels(first: 50) { nodes { name } }
+        files(first: 100) { nodes { path changeType } }
+        reviews(first: 100) { nodes { author { login avatarUrl url } } }
+      }
+    }
+  }
+}
+"""
+
+# Placeholder used by the REST API for deleted accounts
+_GHOST_USER = {
+    'login': 'ghost',
+    'avatar_url': 'https://avatars.githubusercontent.com/u/10137?v=4',
+    'html_url': 'https://github.com/ghost'
+}
+
+# JSON files in the repository root that are not templates
+_NON_TEMPLATE_FILES = frozenset({"package.json", "package-lock.json"})
+
+# Template features counted when the field is non-empty (string fields)
+_NONEMPTY_FEATURES = ('syncPubKeyDomain', 'syncRedirectDomain')
+
+# Template features counted only when the field is literally true (flags)
+_TRUE_FEATURES = ('warnPhishing', 'hostRequired')
+
+# Template features shown in the feature usage charts, in display order
+_FEATURE_KEYS = _NONEMPTY_FEATURES + _TRUE_FEATURES
+
+# Number of newly fetched PRs after which the review cache is written out, so
+# an aborted run keeps most of the API calls it already paid for
+_REVIEW_CACHE_SAVE_INTERVAL = 50
+
+# Below this many templates (or on a single CPU) parsing runs serially: a
+# template parses in about as long as it takes to ship its summary back from
+# a worker process, so the pool only pays off for large sets on several CPUs
+_PARALLEL_PARSE_MIN_TEMPLATES = 5000
+
+
+def _load_json_file(file_path: Path) -> Any:
+    """Read and decode a JSON file, using orjson when available.
+
+    Args:
+        file_path: Path of the JSON file
+
+    Returns:
+        Decoded JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        OSError: If the file cannot be read
+    """
+    # Both decoders work on bytes, which skips a separate utf-8 decode step
+    data = file_path.read_bytes()
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode types the stdlib json module does not handle, as orjson would.
+
+    Args:
+        obj: Object to encode
+
+    Returns:
+        JSON-serializable representation
+    """
+    if isinstance(obj, datetime):
+        # orjson's OPT_UTC_Z spelling of UTC
+        iso = obj.isoformat()
+        return iso[:-6] + 'Z' if iso.endswith('+00:00') else iso
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dump_json(data: Any, pretty: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON, using orjson when available.
+
+    Args:
+        data: Data to encode (non-string dict keys are written as strings,
+            datetimes as ISO-8601 with UTC as 'Z')
+        pretty: Indent the output by two spaces
+
+    Returns:
+        Encoded JSON
+    """
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False,
+                      default=_json_default).encode('utf-8')
+
+
+def _write_if_changed(file_path: Path, payload: bytes) -> bool:
+    """Atomically replace a file's contents unless they are already identical.
+
+    Args:
+        file_path: Destination file
+        payload: New contents
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        # A plain comparison is cheaper than hashing both sides, and stops
+        # at the first differing byte
+        if file_path.stat().st_size == len(payload) and file_path.read_bytes() == payload:
+            return False
+    except OSError:
+        pass
+
+    tmp_path = file_path.with_suffix('.tmp')
+    tmp_path.write_bytes(payload)
+    tmp_path.replace(file_path)
+    return True
+
+
+def _provider_entry(provider_meta: Dict[str, Dict[str, Any]], provider_id: str,
+                    count: int) -> Dict[str, Any]:
+    """Build a top-providers row, looking the provider up only once.
+
+    Args:
+        provider_meta: Provider ID -> {'name', 'logo_url'}
+        provider_id: Provider to describe
+        count: Template count to report
+
+    Returns:
+        Row for the top providers tables (without 'logo_url' if the provider
+        has no logo)
+    """
+    meta = provider_meta.get(provider_id) or {}
+    entry = {
+        'provider_id': provider_id,
+        'provider_name': meta.get('name', provider_id),
+        'template_count': count
+    }
+    # The dashboard treats a missing logo like null, so skip the key
+    logo_url = meta.get('logo_url')
+    if logo_url:
+        entry['logo_url'] = logo_url
+    return entry
+
+
+def _count_by_month(dates: List[str]) -> Tuple[List[str], List[int]]:
+    """Count ISO dates/timestamps per YYYY-MM month.
+
+    Args:
+        dates: ISO-8601 date or timestamp strings
+
+    Returns:
+        Tuple of (sorted months, count per month)
+    """
+    if np is not None and dates:
+        # The U7 dtype truncates each string to YYYY-MM in C
+        months, counts = np.unique(np.array(dates, dtype='U7'), return_counts=True)
+        return months.tolist(), counts.tolist()
+
+    monthly = Counter(date_str[:7] for date_str in dates)
+    months = sorted(monthly)
+    return months, [monthly[month] for month in months]
+
+
+def _monthly_growth(dates: List[str]) -> List[Dict[str, Any]]:
+    """Build a monthly growth series from first-seen dates.
+
+    Args:
+        dates: ISO-8601 date strings, one per added item
+
+    Returns:
+        List of monthly data with 'month', 'added', and 'cumulative' fields
+    """
+    months, counts = _count_by_month(dates)
+    if np is not None and counts:
+        cumulative = np.cumsum(counts).tolist()
+    else:
+        cumulative = list(accumulate(counts))
+
+    return [
+        {'month': month, 'added': added, 'cumulative': total}
+        for month, added, total in zip(months, counts, cumulative)
+    ]
+
+
+def _parse_one(path_str: str) -> Optional[Tuple[Dict[str, Any], Set[str], List[str]]]:
+    """Parse a template and reduce it to what the statistics need.
+
+    Lives at module level so large template sets can be dispatched to worker
+    processes; only the small summary (not the full template) is sent back
+    to the parent.
+
+    Args:
+        path_str: Path to template file
+
+    Returns:
+        Tuple of (template metadata, unique record types, features used),
+        or None if the template is invalid
+    """
+    file_path = Path(path_str)
+    try:
+        template = _load_json_file(file_path)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+        print(f"Warning: Could not parse {file_path.name}: {e}")
+        return None
+    if not template:
+        return None
+
+    records = template.get('records') or []
+    meta = {
+        'filename': file_path.name,
+        'provider_id': template.get('providerId'),
+        'service_id': template.get('serviceId'),
+        'provider_name': template.get('providerName'),
+        'service_name': template.get('serviceName'),
+        'logo_url': template.get('logoUrl'),
+        'record_count': len(records)
+    }
+
+    # Count record types once per template
+    record_types = {r['type'] for r in records if r.get('type')}
+
+    # sync* flags count when non-empty, the others only when explicitly true
+    features = [flag for flag in _NONEMPTY_FEATURES if template.get(flag)]
+    features += [flag for flag in _TRUE_FEATURES if template.get(flag) is True]
+
+    return meta, record_types, features
+
+
+@functools.lru_cache(maxsize=1)
+def _get_git_remotes(repo_path: Path) -> Dict[str, str]:
+    """List git remotes and their fetch URLs with a single `git remote -v`.
+
+    Args:
+        repo_path: Path to the repository root
+
+    Returns:
+        Dictionary mapping remote name to fetch URL (empty if unavailable)
+    """
+    try:
+        result = subprocess.run(
+            ["git", "remote", "-v"],
+            cwd=repo_path,
+            capture_output=True,
+            text=True,
+            check=True
+        )
+    except subprocess.CalledProcessError:
+        return {}
+
+    # Lines look like "<name>\t<url> (fetch)" / "<name>\t<url> (push)"
+    remotes = {}
+    for line in result.stdout.splitlines():
+        name, _, rest = line.partition('\t')
+        url, _, kind = rest.rpartition(' ')
+        if name and kind == '(fetch)':
+            remotes[name] = url
+    return remotes
+
 
 class StatsGenerator:
     """Generate statistics for Domain Connect Templates repository."""
@@ -54,7 +363,12 @@ class StatsGenerator:
         self.repo_path = Path(repo_path).resolve()
         self.github_token = os.environ.get("GITHUB_TOKEN")
         self.github_api = "https://api.github.com"
+        self._graphql_url = f"{self.github_api}/graphql"
         self.cache_file = Path(__file__).parent / "pr_reviews_cache.json"
+        self._http_cache_dir = Path(".cache/github")
+        self._prs_cache: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self.contributors_complete = False
+        self._session = self._create_session()
 
         if repo_owner and repo_name:
             self.repo_owner = repo_owner
@@ -69,56 +383,78 @@ class StatsGenerator:
             remote: Git remote name to use. If None, auto-detected
                     (must be unambiguous — aborts if multiple remotes exist).
         """
-        try:
-            if not remote:
-                remote = self._resolve_remote()
-
-            result = subprocess.run(
-                ["git", "remote", "get-url", remote],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            remote_url = result.stdout.strip()
+        remotes = _get_git_remotes(self.repo_path)
 
-            # Parse GitHub URL (both HTTPS and SSH formats)
-            # https://github.com/owner/repo.git or git@github.com:owner/repo.git
-            match = re.search(r'github\.com[:/](.+?)/(.+?)(?:\.git)?$', remote_url)
-            if match:
-                return match.group(1), match.group(2)
+        if not remote:
+            remote = self._resolve_remote(remotes)
 
-            print(f"Error: Could not parse GitHub owner/repo from remote '{remote}' URL: {remote_url}")
-            sys.exit(1)
-        except subprocess.CalledProcessError:
+        remote_url = remotes.get(remote)
+        if remote_url is None:
             print(f"Error: Git remote '{remote}' not found.")
             sys.exit(1)
 
-    def _resolve_remote(self) -> str:
+        match = _GITHUB_REMOTE_RE.search(remote_url)
+        if match:
+            return match.group(1), match.group(2)
+
+        print(f"Error: Could not parse GitHub owner/repo from remote '{remote}' URL: {remote_url}")
+        sys.exit(1)
+
+    def _resolve_remote(self, remotes: Dict[str, str]) -> str:
         """Resolve which git remote to use.
 
-        Returns the remote name if exactly one exists, aborts otherwise.
-        """
-        result = subprocess.run(
-            ["git", "remote"],
-            cwd=self.repo_path,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        remotes = [r for r in result.stdout.strip().splitlines() if r]
+        Aborts unless exactly one remote exists.
+
+        Args:
+            remotes: Remote name -> fetch URL, from _get_git_remotes()
 
+        Returns:
+            Name of the only remote
+        """
         if len(remotes) == 0:
             print("Error: No git remotes configured.")
             sys.exit(1)
         elif len(remotes) == 1:
-            return remotes[0]
+            return next(iter(remotes))
         else:
             print(f"Error: Multiple git remotes found: {', '.join(remotes)}")
             print("Please specify which remote to use with --remote, "
                   "or provide --repo-owner and --repo-name directly.")
             sys.exit(1)
 
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session shared by all GitHub API calls.
+
+        Reusing one session keeps connections to api.github.com alive, so
+        only the first request pays for the TCP+TLS handshake.
+
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        session.headers.update({"Accept": "application/vnd.github.v3+json"})
+        if self.github_token:
+            session.headers["Authorization"] = f"token {self.github_token}"
+
+        # Secondary rate limits answer 429 with a Retry-After header, which
+        # is waited out instead of the exponential backoff
+        retry = Retry(
+            total=5,
+            backoff_factor=1,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["GET"],
+            respect_retry_after_header=True
+        )
+        # Room for the concurrent page and per-PR fetches of the PR, reviewer
+        # and contributor sections, which run at the same time
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self):
+        """Release pooled HTTP connections."""
+        self._session.close()
+
     def _github_api_request(self, endpoint: str, params: Optional[Dict] = None) -> Any:
         """Make a request to GitHub API.
 
@@ -129,20 +465,126 @@ class StatsGenerator:
         Returns:
             JSON response data
         """
+        return self._github_api_request_raw(endpoint, params)[0]
+
+    def _github_api_request_raw(self, endpoint: str,
+                                params: Optional[Dict] = None) -> Tuple[Any, Dict[str, Dict[str, str]]]:
+        """Make a request to GitHub API, also returning pagination links.
+
+        Args:
+            endpoint: API endpoint (without base URL)
+            params: Query parameters
+
+        Returns:
+            Tuple of (JSON response data, parsed Link header keyed by rel)
+        """
         url = f"{self.github_api}{endpoint}"
-        headers = {"Accept": "application/vnd.github.v3+json"}
 
-        if self.github_token:
-            headers["Authorization"] = f"token {self.github_token}"
+        # Conditional requests: a 304 costs no rate limit and carries no body.
+        # Later pages are not cached, as their contents shift between runs.
+        cache_path = None
+        cached = None
+        headers = {}
+        if not params or params.get("page", 1) <= 1:
+            cache_path = self._http_cache_path(url, params)
+            cached = self._load_http_cache(cache_path)
+            # Entries written before incomplete pages were excluded
+            if cached and not self._is_complete_response(cached.get("body"), cached.get("links", {}), params):
+                cached = None
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
 
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = self._session.get(url, params=params, headers=headers, timeout=30)
+            if response.status_code == 304 and cached:
+                return cached["body"], cached.get("links", {})
             response.raise_for_status()
-            return response.json()
+            data = response.json()
         except requests.exceptions.RequestException as e:
             print(f"Warning: GitHub API request failed: {e}")
+            return None, {}
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if (cache_path and (etag or last_modified)
+                and self._is_complete_response(data, response.links, params)):
+            self._save_http_cache(cache_path, etag, last_modified, data, response.links)
+        return data, response.links
+
+    @staticmethod
+    def _is_complete_response(body: Any, links: Dict[str, Dict[str, str]],
+                              params: Optional[Dict]) -> bool:
+        """Check that a response holds the whole result, so a 304 can reuse it.
+
+        The ETag only covers the page body: a list can grow past its first
+        page while that page stays unchanged, and the Link header cached with
+        it would then hide the new pages.
+
+        Args:
+            body: Decoded JSON response
+            links: Parsed Link header keyed by rel
+            params: Query parameters
+
+        Returns:
+            False if more pages exist or may appear (a full first page)
+        """
+        if 'next' in links:
+            return False
+        per_page = (params or {}).get("per_page")
+        return not (per_page and isinstance(body, list) and len(body) >= per_page)
+
+    def _http_cache_path(self, url: str, params: Optional[Dict]) -> Path:
+        """Get the HTTP cache file for a request.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Path of the cache entry for this URL and parameters
+        """
+        key = json.dumps([url, params or {}], sort_keys=True)
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return self._http_cache_dir / f"{digest}.json"
+
+    def _load_http_cache(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached response ({'etag', 'last_modified', 'body', 'links'}) if one exists.
+
+        Args:
+            cache_path: Path of the cache entry
+
+        Returns:
+            Cached entry or None if missing or unreadable
+        """
+        try:
+            return _load_json_file(cache_path)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             return None
 
+    def _save_http_cache(self, cache_path: Path, etag: Optional[str],
+                         last_modified: Optional[str], body: Any,
+                         links: Dict[str, Dict[str, str]]):
+        """Store a response body together with its validators and Link header.
+
+        Args:
+            cache_path: Path of the cache entry
+            etag: ETag header returned by GitHub
+            last_modified: Last-Modified header returned by GitHub
+            body: Decoded JSON response
+            links: Parsed Link header (needed to paginate from a 304)
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            tmp_path.write_bytes(_dump_json(
+                {'etag': etag, 'last_modified': last_modified, 'body': body, 'links': links}))
+            tmp_path.replace(cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write HTTP cache: {e}")
+
     def _get_all_paginated(self, endpoint: str, params: Optional[Dict] = None) -> List[Any]:
         """Get all pages of a paginated GitHub API endpoint.
 
@@ -153,176 +595,276 @@ class StatsGenerator:
         Returns:
             List of all items across all pages
         """
+        return self._get_all_pages(endpoint, params)[0]
+
+    def _get_all_pages(self, endpoint: str, params: Optional[Dict] = None,
+                       first_response: Optional[Tuple[Any, Dict[str, Dict[str, str]]]] = None
+                       ) -> Tuple[List[Any], bool]:
+        """Get all pages of a paginated GitHub API endpoint, reporting failures.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            first_response: Already fetched (data, links) of page 1, if any
+
+        Returns:
+            Tuple of (list of all items across all pages, False if a page
+            request failed and the list is incomplete)
+        """
         if params is None:
             params = {}
-        
+
         params.setdefault("per_page", 100)
         params.setdefault("page", 1)
 
         all_items = []
+        complete = True
 
-        print(f"    [DEBUG] Paginating {endpoint} with params: {params}")
+        logger.debug("    [DEBUG] Paginating %s with params: %s", endpoint, params)
 
         while True:
-            items = self._github_api_request(endpoint, params)
+            if first_response is not None:
+                items, links = first_response
+                first_response = None
+            else:
+                items, links = self._github_api_request_raw(endpoint, params)
+            if items is None:
+                logger.debug("    [DEBUG] Page %s: request failed, stopping", params['page'])
+                complete = False
+                break
             if not items:
-                print(f"    [DEBUG] Page {params['page']}: empty response, stopping")
+                logger.debug("    [DEBUG] Page %s: empty response, stopping", params['page'])
                 break
 
             all_items.extend(items)
-            print(f"    [DEBUG] Page {params['page']}: got {len(items)} items (total so far: {len(all_items)})")
+            logger.debug("    [DEBUG] Page %s: got %d items (total so far: %d)",
+                         params['page'], len(items), len(all_items))
+
+            # The Link header is authoritative; page size is not
+            if 'next' not in links:
+                logger.debug("    [DEBUG] Last page reached (no rel=\"next\" link)")
+                break
 
-            # Check if there are more pages
-            if len(items) < params["per_page"]:
-                print(f"    [DEBUG] Last page reached (got {len(items)} < {params['per_page']})")
+            # When the page count is known, fetch the remaining pages concurrently
+            last_page = self._last_page_number(links)
+            if last_page:
+                items, complete = self._fetch_pages(endpoint, params, params["page"] + 1, last_page)
+                all_items.extend(items)
                 break
 
             params["page"] += 1
 
-        print(f"    [DEBUG] Done paginating {endpoint}: {len(all_items)} total items")
-        return all_items
+        logger.debug("    [DEBUG] Done paginating %s: %d total items", endpoint, len(all_items))
+        return all_items, complete
 
-    def get_template_files(self) -> List[Path]:
-        """Get all template JSON files in repository root.
+    @staticmethod
+    def _last_page_number(links: Dict[str, Dict[str, str]]) -> Optional[int]:
+        """Get the page number of the rel="last" Link header entry.
+
+        Args:
+            links: Parsed Link header keyed by rel
 
         Returns:
-            List of template file paths
+            Last page number or None if not advertised
         """
-        template_files = []
-        for file_path in self.repo_path.glob("*.json"):
-            # Skip non-template files
-            if file_path.name in ["package.json", "package-lock.json"]:
-                continue
-            template_files.append(file_path)
+        last_url = links.get('last', {}).get('url')
+        if not last_url:
+            return None
+        page = parse_qs(urlparse(last_url).query).get('page')
+        try:
+            return int(page[0]) if page else None
+        except ValueError:
+            return None
+
+    def _fetch_pages(self, endpoint: str, params: Dict, first_page: int,
+                     last_page: int) -> Tuple[List[Any], bool]:
+        """Fetch a known range of pages concurrently.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters (the page number is overridden)
+            first_page: First page to fetch
+            last_page: Last page to fetch (inclusive)
 
-        return sorted(template_files)
+        Returns:
+            Tuple of (items of the pages in page order, stopping at the first
+            empty or failed page like the sequential walk would, False if a
+            page request failed)
+        """
+        def fetch(page: int) -> Any:
+            return self._github_api_request_raw(endpoint, {**params, "page": page})[0]
 
-    def parse_template(self, file_path: Path) -> Optional[Dict[str, Any]]:
-        """Parse a template JSON file.
+        pages = range(first_page, last_page + 1)
+        all_items = []
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            for page, items in zip(pages, executor.map(fetch, pages)):
+                if items is None:
+                    logger.debug("    [DEBUG] Page %s: request failed, stopping", page)
+                    return all_items, False
+                if not items:
+                    logger.debug("    [DEBUG] Page %s: empty response, stopping", page)
+                    break
+                all_items.extend(items)
+                logger.debug("    [DEBUG] Page %s: got %d items", page, len(items))
+        return all_items, True
+
+    def _graphql(self, query: str, variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run a GitHub GraphQL query.
 
         Args:
-            file_path: Path to template file
+            query: GraphQL query document
+            variables: Query variables
 
         Returns:
-            Parsed template data or None if invalid
+            The response's 'data' object, or None on failure
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError) as e:
-            print(f"Warning: Could not parse {file_path.name}: {e}")
+            response = self._session.post(
+                self._graphql_url,
+                json={'query': query, 'variables': variables},
+                timeout=60
+            )
+            response.raise_for_status()
+            result = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Warning: GitHub GraphQL request failed: {e}")
             return None
 
-    def get_record_types(self, template: Dict[str, Any]) -> Set[str]:
-        """Extract unique record types from a template.
+        if result.get('errors'):
+            print(f"Warning: GitHub GraphQL query returned errors: {result['errors']}")
+            return None
+        return result.get('data')
 
-        Args:
-            template: Parsed template data
+    def get_template_files(self) -> List[Path]:
+        """Get all template JSON files in repository root.
 
         Returns:
-            Set of record types (e.g., 'A', 'CNAME', 'MX')
+            List of template file paths
         """
-        record_types = set()
-        records = template.get("records", [])
+        # Filter on DirEntry names so Path objects are only built for templates
+        with os.scandir(self.repo_path) as entries:
+            names = [
+                entry.name for entry in entries
+                if entry.name.endswith(".json") and entry.name not in _NON_TEMPLATE_FILES and entry.is_file()
+            ]
 
-        for record in records:
-            record_type = record.get("type")
-            if record_type:
-                record_types.add(record_type)
-
-        return record_types
+        return [self.repo_path / name for name in sorted(names)]
 
     def get_git_history(self) -> List[Dict[str, Any]]:
         """Get git commit history for template files.
 
+        Returns:
+            List of commit info dictionaries (newest first)
+        """
+        return self._run_git_log(["--all"])
+
+    def _get_recent_commits(self, days: int) -> List[Dict[str, Any]]:
+        """Get commits from the last `days` days.
+
+        Lets git filter by date instead of scanning the full history in Python.
+
+        Args:
+            days: Size of the time window in days
+
         Returns:
             List of commit info dictionaries
         """
-        try:
-            # Get all commits with file changes
-            result = subprocess.run(
-                ["git", "log", "--all", "--date=short", "--name-only",
-                 "--pretty=format:%ad|%H|%an|%ae"],
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+        return self._run_git_log(["--all", f"--since={days} days ago"])
 
-            commits = []
-            lines = result.stdout.strip().split('\n')
-            current_commit = None
+    def _run_git_log(self, extra_args: List[str]) -> List[Dict[str, Any]]:
+        """Run git log and parse commits with their changed template files.
 
-            for line in lines:
-                if not line.strip():
-                    continue
+        Args:
+            extra_args: Additional git log arguments (revisions, filters)
 
-                if '|' in line:
-                    # Commit header line
-                    parts = line.split('|')
-                    if len(parts) == 4:
-                        current_commit = {
-                            'date': parts[0],
-                            'hash': parts[1],
-                            'author': parts[2],
-                            'email': parts[3],
-                            'files': []
-                        }
-                        commits.append(current_commit)
-                elif current_commit and line.endswith('.json'):
-                    # File change line
-                    current_commit['files'].append(line)
-
-            return commits
-        except subprocess.CalledProcessError as e:
-            print(f"Warning: Could not get git history: {e}")
+        Returns:
+            List of commit info dictionaries
+        """
+        # NUL-separated output keeps filenames containing newlines or '|'
+        # intact: each commit is "header\0\nfile\0file\0", with "\0\0"
+        # between commits
+        cmd = ["git", "log", *extra_args, "-z", "--date=short", "--name-only",
+               "--pretty=format:%ad|%H|%an|%ae%x00"]
+
+        # Stream the output so parsing overlaps with git and memory stays
+        # bounded by the read size rather than the full history
+        commits = []
+        pending = b''
+        with subprocess.Popen(cmd, cwd=self.repo_path, stdout=subprocess.PIPE,
+                              stderr=subprocess.DEVNULL) as proc:
+            for chunk in iter(lambda: proc.stdout.read(65536), b''):
+                pending += chunk
+                *records, pending = pending.split(b'\0\0')
+                for record in records:
+                    self._parse_git_log_record(record, commits)
+            self._parse_git_log_record(pending, commits)
+
+        if proc.returncode != 0:
+            print(f"Warning: Could not get git history: git log exited with status {proc.returncode}")
             return []
 
-    def calculate_monthly_growth(self, commits: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate monthly template growth statistics.
+        return commits
+
+    def _parse_git_log_record(self, record: bytes, commits: List[Dict[str, Any]]):
+        """Parse one NUL-separated git log commit record.
+
+        Args:
+            record: Raw commit record ("header\0\nfile\0file\0...")
+            commits: List the parsed commit is appended to
+        """
+        header, _, file_list = record.decode('utf-8', errors='replace').partition('\0')
+        parts = header.split('|', 3)
+        if len(parts) != 4:
+            return
+
+        commits.append({
+            'date': parts[0],
+            'hash': parts[1],
+            'author': parts[2],
+            'email': parts[3],
+            'files': [
+                file for file in file_list.lstrip('\n').split('\0')
+                if file.endswith('.json')
+            ]
+        })
+
+    def _compute_template_first_seen(self, commits: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Determine when each template file was first committed.
 
         Args:
-            commits: List of commit data
+            commits: List of commit data from get_git_history() (newest first)
 
         Returns:
-            Dictionary with monthly statistics
+            Dictionary mapping filename to the date (YYYY-MM-DD) it first appeared
         """
-        # Track when each template was first added
         template_first_seen = {}
 
-        # Process commits in chronological order (oldest first)
-        for commit in reversed(commits):
+        # Commits are newest first, so the oldest date is the last one written.
+        # get_git_history() already keeps only .json files.
+        for commit in commits:
             commit_date = commit['date']
             for file in commit['files']:
-                if file.endswith('.json') and file not in template_first_seen:
-                    template_first_seen[file] = commit_date
+                template_first_seen[file] = commit_date
 
-        # Group by month
-        monthly_additions = defaultdict(int)
-        for template, date_str in template_first_seen.items():
-            # Convert to YYYY-MM format
-            year_month = date_str[:7]  # Get YYYY-MM from YYYY-MM-DD
-            monthly_additions[year_month] += 1
-
-        # Calculate cumulative totals
-        sorted_months = sorted(monthly_additions.keys())
-        cumulative = 0
-        monthly_data = []
-
-        for month in sorted_months:
-            cumulative += monthly_additions[month]
-            monthly_data.append({
-                'month': month,
-                'added': monthly_additions[month],
-                'cumulative': cumulative
-            })
+        return template_first_seen
+
+    def calculate_monthly_growth(self, template_first_seen: Dict[str, str]) -> Dict[str, Any]:
+        """Calculate monthly template growth statistics.
+
+        Args:
+            template_first_seen: Filename -> first commit date, from _compute_template_first_seen()
+
+        Returns:
+            Dictionary with monthly statistics
+        """
+        monthly_data = _monthly_growth(list(template_first_seen.values()))
 
         return {
             'monthly': monthly_data,
-            'total_templates': cumulative
+            'total_templates': monthly_data[-1]['cumulative'] if monthly_data else 0
         }
 
-    def calculate_provider_growth(self, commits: List[Dict[str, Any]],
+    def calculate_provider_growth(self, template_first_seen: Dict[str, str],
                                   templates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Calculate monthly provider growth statistics.
 
@@ -331,7 +873,7 @@ class StatsGenerator:
         (which contains the actual providerId).
 
         Args:
-            commits: List of commit data from get_git_history()
+            template_first_seen: Filename -> first commit date, from _compute_template_first_seen()
             templates: List of parsed template dicts (must have 'filename' and 'provider_id')
 
         Returns:
@@ -344,14 +886,6 @@ class StatsGenerator:
             if provider_id:
                 filename_to_provider[t['filename']] = provider_id
 
-        # Track when each file was first seen in git history
-        template_first_seen = {}
-        for commit in reversed(commits):
-            commit_date = commit['date']
-            for file in commit['files']:
-                if file.endswith('.json') and file not in template_first_seen:
-                    template_first_seen[file] = commit_date
-
         # Determine when each provider was first seen
         provider_first_seen = {}
         for filename, date_str in template_first_seen.items():
@@ -361,56 +895,167 @@ class StatsGenerator:
             if provider_id not in provider_first_seen or date_str < provider_first_seen[provider_id]:
                 provider_first_seen[provider_id] = date_str
 
-        # Group by month
-        monthly_additions = defaultdict(int)
-        for provider, date_str in provider_first_seen.items():
-            year_month = date_str[:7]
-            monthly_additions[year_month] += 1
-
-        # Calculate cumulative totals
-        sorted_months = sorted(monthly_additions.keys())
-        cumulative = 0
-        monthly_data = []
-
-        for month in sorted_months:
-            cumulative += monthly_additions[month]
-            monthly_data.append({
-                'month': month,
-                'added': monthly_additions[month],
-                'cumulative': cumulative
-            })
-
-        return monthly_data
+        return _monthly_growth(list(provider_first_seen.values()))
 
     def fetch_all_prs_once(self) -> Dict[str, List[Dict[str, Any]]]:
         """Fetch all PRs from GitHub API once (to avoid multiple API calls).
 
+        The result is memoized, so every consumer shares a single walk.
+
         Returns:
             Dictionary with 'open' and 'closed' PR lists
         """
+        if self._prs_cache is not None:
+            return self._prs_cache
+
         if not self.github_token:
             print("Warning: GITHUB_TOKEN not set. PR data will be limited.")
             return {'open': [], 'closed': []}
 
-        # Get all open PRs
-        open_prs = self._get_all_paginated(
-            f"/repos/{self.repo_owner}/{self.repo_name}/pulls",
-            {"state": "open"}
-        )
+        # GraphQL returns files and reviews along with each PR, replacing the
+        # per-PR REST calls; fall back to the REST listing if it fails
+        all_prs = self._fetch_prs_graphql()
+        if all_prs is None:
+            # One walk over all PRs (sorted by update time) instead of separate
+            # open and closed paginations
+            all_prs = self._get_all_paginated(
+                f"/repos/{self.repo_owner}/{self.repo_name}/pulls",
+                {"state": "all", "sort": "updated", "direction": "desc"}
+            )
 
-        # Get all closed PRs (sorted by update time)
-        closed_prs = self._get_all_paginated(
-            f"/repos/{self.repo_owner}/{self.repo_name}/pulls",
-            {"state": "closed", "sort": "updated", "direction": "desc"}
+        # Open PRs keep the API's default order (newest first)
+        open_prs = sorted(
+            (pr for pr in all_prs if pr['state'] == 'open'),
+            key=itemgetter('created_at'),
+            reverse=True
         )
+        closed_prs = [pr for pr in all_prs if pr['state'] != 'open']
+
+        self._prs_cache = {'open': open_prs, 'closed': closed_prs}
+        return self._prs_cache
+
+    def _fetch_prs_graphql(self) -> Optional[List[Dict[str, Any]]]:
+        """Fetch all PRs, with changed files and reviews, via GraphQL.
+
+        Returns:
+            List of PRs in REST API shape (plus 'files' and 'reviews'),
+            or None if the query failed
+        """
+        prs = []
+        cursor = None
+        while True:
+            data = self._graphql(_PULL_REQUESTS_QUERY, {
+                'owner': self.repo_owner,
+                'name': self.repo_name,
+                'cursor': cursor
+            })
+            if data is None:
+                return None
+
+            connection = data['repository']['pullRequests']
+            prs.extend(self._graphql_pr_to_rest(node) for node in connection['nodes'])
+            logger.debug("    [DEBUG] GraphQL: got %d PRs (total so far: %d)",
+                         len(connection['nodes']), len(prs))
 
-        return {'open': open_prs, 'closed': closed_prs}
+            if not connection['pageInfo']['hasNextPage']:
+                return prs
+            cursor = connection['pageInfo']['endCursor']
 
-    def get_pull_requests(self, all_prs: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _graphql_user_to_rest(author: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Map a GraphQL actor onto the REST user fields used here.
+
+        Args:
+            author: Actor with login, avatarUrl and url, or None for a deleted
+                (ghost) account
+
+        Returns:
+            User dict with 'login', 'avatar_url' and 'html_url', or None when
+            the actor is None, like REST's null user
+        """
+        if not author:
+            return None
+        return {
+            'login': author['login'],
+            'avatar_url': author['avatarUrl'],
+            'html_url': author['url']
+        }
+
+    def _graphql_pr_to_rest(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a GraphQL pull request node onto the REST API dict shape.
+
+        Args:
+            node: PullRequest node from _PULL_REQUESTS_QUERY
+
+        Returns:
+            PR dict as returned by /pulls, with 'files' (as from /pulls/{n}/files)
+            and 'reviews' (as from /pulls/{n}/reviews) embedded
+        """
+        return {
+            'number': node['number'],
+            'title': node['title'],
+            'state': 'open' if node['state'] == 'OPEN' else 'closed',
+            'created_at': node['createdAt'],
+            'updated_at': node['updatedAt'],
+            'merged_at': node['mergedAt'],
+            'user': self._graphql_user_to_rest(node['author']) or _GHOST_USER,
+            'html_url': node['url'],
+            'labels': [{'name': label['name']} for label in node['labels']['nodes']],
+            'files': [
+                {
+                    'filename': file['path'],
+                    'status': 'removed' if file['changeType'] == 'DELETED' else file['changeType'].lower()
+                }
+                for file in node['files']['nodes']
+            ],
+            'reviews': [
+                {'user': self._graphql_user_to_rest(review['author'])}
+                for review in node['reviews']['nodes']
+            ]
+        }
+
+    def _fetch_per_pr(self, pr_numbers: List[int], resource: str,
+                      on_result: Optional[Callable[[int, Any], None]] = None) -> Dict[int, Any]:
+        """Fetch a per-PR resource (e.g. 'files', 'reviews') for several PRs concurrently.
+
+        The requests are latency-bound, so they are spread over a small thread
+        pool sharing the HTTP session. The pool size stays below the adapter's
+        pool_maxsize and keeps us clear of GitHub's secondary rate limits.
+
+        Args:
+            pr_numbers: PR numbers to fetch the resource for
+            resource: Sub-resource of /pulls/{number}
+            on_result: Called from the calling thread with (PR number, response)
+                as each request completes
+
+        Returns:
+            Dictionary mapping PR number to the API response (None on failure)
+        """
+        if not pr_numbers:
+            return {}
+
+        pulls_endpoint = f"/repos/{self.repo_owner}/{self.repo_name}/pulls"
+
+        def fetch(pr_number: int) -> Any:
+            return self._github_api_request(f"{pulls_endpoint}/{pr_number}/{resource}")
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = {executor.submit(fetch, pr_number): pr_number for pr_number in pr_numbers}
+            for future in as_completed(futures):
+                pr_number = futures[future]
+                results[pr_number] = future.result()
+                if on_result:
+                    on_result(pr_number, results[pr_number])
+        return results
+
+    def get_pull_requests(self, all_prs: Dict[str, List[Dict[str, Any]]],
+                          logo_by_filename: Dict[str, Optional[str]]) -> List[Dict[str, Any]]:
         """Process pull request data for display.
 
         Args:
             all_prs: Pre-fetched dictionary with 'open' and 'closed' PR lists
+            logo_by_filename: Template filename -> logoUrl from the parsed templates
 
         Returns:
             List of PR data for display
@@ -427,6 +1072,12 @@ class StatsGenerator:
         # Combine open + recently merged
         combined_prs = open_prs + merged_prs
 
+        # Get files changed in each PR
+        # PRs from GraphQL already carry their files
+        pr_files = self._fetch_per_pr(
+            [pr['number'] for pr in combined_prs if 'files' not in pr], 'files'
+        )
+
         # Extract relevant PR information
         pr_data = []
         for pr in combined_prs:
@@ -445,38 +1096,30 @@ class StatsGenerator:
                 'templates': []  # Will be filled by analyzing files
             }
 
-            # Get files changed in this PR
-            files = self._github_api_request(
-                f"/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr['number']}/files"
-            )
+            files = pr['files'] if 'files' in pr else pr_files.get(pr['number'])
+            for file in files or []:
+                filename = file['filename']
+                if not filename.endswith('.json') or '/' in filename:
+                    continue
+
+                # Extract provider and service from filename
+                provider_id, _, service_id = filename[:-5].partition('.')
+                if not service_id:
+                    continue
 
-            if files:
-                for file in files:
-                    filename = file['filename']
-                    if filename.endswith('.json') and '/' not in filename:
-                        # Extract provider and service from filename
-                        parts = filename.replace('.json', '').split('.')
-                        if len(parts) >= 2:
-                            provider_id = parts[0]
-                            service_id = '.'.join(parts[1:])
-
-                            # Try to get logo from template content
-                            logo_url = None
-                            if file['status'] != 'removed':
-                                # Try to read current version of file
-                                template_path = self.repo_path / filename
-                                if template_path.exists():
-                                    template_data = self.parse_template(template_path)
-                                    if template_data:
-                                        logo_url = template_data.get('logoUrl')
-
-                            pr_info['templates'].append({
-                                'provider_id': provider_id,
-                                'service_id': service_id,
-                                'filename': filename,
-                                'logo_url': logo_url,
-                                'status': file['status']
-                            })
+                template_info = {
+                    'provider_id': provider_id,
+                    'service_id': service_id,
+                    'filename': filename,
+                    'status': file['status']
+                }
+                # Logo from the current version of the template (already
+                # parsed); omitted rather than null when there is none
+                if file['status'] != 'removed':
+                    logo_url = logo_by_filename.get(filename)
+                    if logo_url:
+                        template_info['logo_url'] = logo_url
+                pr_info['templates'].append(template_info)
 
             pr_data.append(pr_info)
 
@@ -497,36 +1140,33 @@ class StatsGenerator:
         # Combine all PRs
         combined_prs = all_prs.get('open', []) + all_prs.get('closed', [])
 
-        # Group by month
-        monthly_created = defaultdict(int)
-        monthly_merged = defaultdict(int)
-        total_merged = 0
+        created_dates = []
+        merged_dates = []
         total_open = 0
 
         for pr in combined_prs:
-            # Created date
-            created_date = pr['created_at'][:7]  # YYYY-MM
-            monthly_created[created_date] += 1
-
-            # Merged date
-            if pr.get('merged_at'):
-                merged_date = pr['merged_at'][:7]  # YYYY-MM
-                monthly_merged[merged_date] += 1
-                total_merged += 1
-
+            created_dates.append(pr['created_at'])
+            merged_at = pr.get('merged_at')
+            if merged_at:
+                merged_dates.append(merged_at)
             if pr['state'] == 'open':
                 total_open += 1
 
-        # Combine data
-        all_months = sorted(set(list(monthly_created.keys()) + list(monthly_merged.keys())))
-        monthly_data = []
+        # Group by month
+        monthly_created = dict(zip(*_count_by_month(created_dates)))
+        monthly_merged = dict(zip(*_count_by_month(merged_dates)))
+        total_merged = len(merged_dates)
 
-        for month in all_months:
-            monthly_data.append({
+        # Combine data
+        all_months = sorted(monthly_created.keys() | monthly_merged.keys())
+        monthly_data = [
+            {
                 'month': month,
-                'created': monthly_created[month],
-                'merged': monthly_merged[month]
-            })
+                'created': monthly_created.get(month, 0),
+                'merged': monthly_merged.get(month, 0)
+            }
+            for month in all_months
+        ]
 
         return {
             'monthly': monthly_data,
@@ -534,21 +1174,61 @@ class StatsGenerator:
             'total_open': total_open
         }
 
-    def get_contributors(self) -> List[Dict[str, Any]]:
+    def get_contributors(self, previous_stats: Optional[Dict[str, Any]] = None) -> Tuple[List[Dict[str, Any]], int]:
         """Get repository contributors from GitHub API.
 
+        When the previous stats.json holds a complete, non-empty contributor
+        list, the first page is requested with If-Modified-Since; a 304 reuses
+        the previous contributor data and skips the pagination entirely, a 200
+        is used as the first page.
+
+        Also records in `contributors_complete` whether the returned list is
+        complete, so the next run knows whether it may be reused.
+
+        Args:
+            previous_stats: Statistics from the previous run, if any
+
         Returns:
-            List of contributor data
+            Tuple of (list of contributor data, total number of contributors)
         """
+        self.contributors_complete = False
         if not self.github_token:
-            return []
-
-        contributors = self._get_all_paginated(
-            f"/repos/{self.repo_owner}/{self.repo_name}/contributors"
-        )
+            return [], 0
+
+        endpoint = f"/repos/{self.repo_owner}/{self.repo_name}/contributors"
+        params = {"per_page": 100}
+        first_response = None
+
+        # An empty or partial list (tokenless run, failed fetch) must not be
+        # carried over just because upstream has not changed since
+        if (previous_stats and previous_stats.get('generated_at') and previous_stats.get('contributors')
+                and previous_stats.get('_contributors_complete')):
+            try:
+                generated_at = datetime.fromisoformat(
+                    previous_stats['generated_at'].replace('Z', '+00:00')
+                ).astimezone(timezone.utc)
+                response = self._session.get(
+                    f"{self.github_api}{endpoint}",
+                    params=params,
+                    headers={"If-Modified-Since": format_datetime(generated_at, usegmt=True)},
+                    timeout=30
+                )
+                if response.status_code == 304:
+                    print("    - Contributors unchanged since last run, reusing previous data")
+                    self.contributors_complete = True
+                    return (previous_stats['contributors'],
+                            previous_stats.get('summary', {}).get('total_contributors',
+                                                                  len(previous_stats['contributors'])))
+                response.raise_for_status()
+                first_response = (response.json(), response.links)
+            except (ValueError, requests.exceptions.RequestException) as e:
+                print(f"    - Warning: Conditional contributors request failed: {e}")
+
+        contributors, complete = self._get_all_pages(endpoint, params, first_response)
 
         if not contributors:
-            return []
+            return [], 0
+        self.contributors_complete = complete
 
         contributor_data = []
         for contrib in contributors:
@@ -559,7 +1239,7 @@ class StatsGenerator:
                 'profile_url': contrib['html_url']
             })
 
-        return contributor_data
+        return contributor_data, len(contributor_data)
 
     def load_review_cache(self) -> Dict[int, List[Dict[str, Any]]]:
         """Load PR review data from cache file.
@@ -571,11 +1251,10 @@ class StatsGenerator:
             return {}
 
         try:
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
-                # Convert string keys back to integers
-                return {int(k): v for k, v in cache_data.items()}
-        except (json.JSONDecodeError, IOError) as e:
+            cache_data = _load_json_file(self.cache_file)
+            # JSON object keys are always strings, convert them back to integers
+            return {int(k): v for k, v in cache_data.items()}
+        except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
             print(f"    - Warning: Could not load review cache: {e}")
             return {}
 
@@ -586,17 +1265,23 @@ class StatsGenerator:
             cache: Dictionary mapping PR number to list of reviews
         """
         try:
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache, f, indent=2, ensure_ascii=False)
+            # Kept indented since the cache file is committed to the repository.
+            # Written via a temporary file so an interrupted save cannot
+            # leave a truncated cache behind.
+            tmp_path = self.cache_file.with_suffix('.tmp')
+            tmp_path.write_bytes(_dump_json(cache, pretty=True))
+            tmp_path.replace(self.cache_file)
             print(f"    - Saved review cache to {self.cache_file.name}")
         except IOError as e:
             print(f"    - Warning: Could not save review cache: {e}")
 
-    def get_top_reviewers(self, all_prs: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+    def get_top_reviewers(self, all_prs: Dict[str, List[Dict[str, Any]]],
+                          now: Optional[datetime] = None) -> Dict[str, Any]:
         """Get top PR reviewers from GitHub API (with caching).
 
         Args:
             all_prs: Pre-fetched dictionary with 'open' and 'closed' PR lists
+            now: Timezone-aware reference time for the 30-day window (default: now)
 
         Returns:
             Dictionary with all-time and last 30 days top reviewers
@@ -612,44 +1297,70 @@ class StatsGenerator:
 
         # Load review cache
         review_cache = self.load_review_cache()
-        cache_hits = 0
-        cache_misses = 0
+
+        # Fetch reviews of uncached PRs up front, concurrently (PRs from
+        # GraphQL already carry their reviews). The cache is saved as results
+        # come in, so progress survives an aborted run.
+        to_fetch = [pr['number'] for pr in merged_prs
+                    if pr['number'] not in review_cache and 'reviews' not in pr]
+        cache_hits = sum(1 for pr in merged_prs if pr['number'] in review_cache)
+        cache_misses = len(merged_prs) - cache_hits
+        fetched = 0
+        unsaved = 0
+
+        def remember(pr_number: int, reviews: Optional[List[Dict[str, Any]]]):
+            nonlocal fetched, unsaved
+            fetched += 1
+            # Progress log every 50 PRs
+            if fetched % 50 == 0 or fetched == len(to_fetch):
+                logger.debug("      Progress: Fetched reviews of %d/%d PRs (cache hits: %d, misses: %d)...",
+                             fetched, len(to_fetch), cache_hits, cache_misses)
+            if reviews is None:
+                return
+            review_cache[pr_number] = reviews
+            unsaved += 1
+            if unsaved >= _REVIEW_CACHE_SAVE_INTERVAL:
+                self.save_review_cache(review_cache)
+                unsaved = 0
+
+        try:
+            fetched_reviews = self._fetch_per_pr(to_fetch, 'reviews', on_result=remember)
+        finally:
+            if unsaved:
+                self.save_review_cache(review_cache)
+                unsaved = 0
 
         # Calculate reviewer statistics
-        reviewer_stats_all_time = defaultdict(lambda: {'reviews': 0, 'avatar_url': None, 'profile_url': None})
-        reviewer_stats_30_days = defaultdict(lambda: {'reviews': 0, 'avatar_url': None, 'profile_url': None})
+        # Avatar and profile URL are filled in from the first review seen
+        reviewer_stats_all_time = defaultdict(lambda: {'reviews': 0})
+        reviewer_stats_30_days = defaultdict(lambda: {'reviews': 0})
 
-        thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+        # merged_at is always UTC in YYYY-MM-DDTHH:MM:SSZ form, so the cutoff
+        # can be compared as a string without parsing every timestamp
+        if now is None:
+            now = datetime.now(timezone.utc)
+        thirty_days_ago = (now.astimezone(timezone.utc) - timedelta(days=30)).strftime('%Y-%m-%dT%H:%M:%SZ')
 
-        total_prs = len(merged_prs)
-        for idx, pr in enumerate(merged_prs, 1):
+        for pr in merged_prs:
             pr_number = pr['number']
             merged_at = pr.get('merged_at')
 
             if not merged_at:
                 continue
 
-            # Parse merged_at date
-            merged_date = datetime.fromisoformat(merged_at.replace('Z', '+00:00'))
-            is_recent = merged_date >= thirty_days_ago
+            is_recent = merged_at >= thirty_days_ago
 
-            # Progress log every 50 PRs
-            if idx % 50 == 0:
-                print(f"      Progress: Processed {idx}/{total_prs} PRs (cache hits: {cache_hits}, misses: {cache_misses})...")
-
-            # Check cache first
-            if pr_number in review_cache:
+            # Check cache first (freshly fetched PRs were already added to it)
+            if pr_number in fetched_reviews:
+                reviews = fetched_reviews[pr_number]
+            elif pr_number in review_cache:
                 reviews = review_cache[pr_number]
-                cache_hits += 1
             else:
-                # Get reviews from API
-                reviews = self._github_api_request(
-                    f"/repos/{self.repo_owner}/{self.repo_name}/pulls/{pr_number}/reviews"
-                )
+                reviews = pr.get('reviews')
                 # Store in cache
                 if reviews is not None:
                     review_cache[pr_number] = reviews
-                cache_misses += 1
+                    unsaved += 1
 
             if reviews:
                 # Track unique reviewers per PR (count each reviewer once per PR)
@@ -659,17 +1370,19 @@ class StatsGenerator:
                     if not review.get('user'):
                         continue
 
-                    reviewer = review['user']['login']
+                    user = review['user']
+                    reviewer = user['login']
                     # Skip if reviewer is the PR author (self-reviews don't count)
                     if reviewer != pr['user']['login']:
                         reviewers_in_pr.add(reviewer)
                         # Store avatar and profile URL
-                        if not reviewer_stats_all_time[reviewer]['avatar_url']:
-                            reviewer_stats_all_time[reviewer]['avatar_url'] = review['user']['avatar_url']
-                            reviewer_stats_all_time[reviewer]['profile_url'] = review['user']['html_url']
-                        if is_recent and not reviewer_stats_30_days[reviewer]['avatar_url']:
-                            reviewer_stats_30_days[reviewer]['avatar_url'] = review['user']['avatar_url']
-                            reviewer_stats_30_days[reviewer]['profile_url'] = review['user']['html_url']
+                        entry = reviewer_stats_all_time[reviewer]
+                        entry.setdefault('avatar_url', user['avatar_url'])
+                        entry.setdefault('profile_url', user['html_url'])
+                        if is_recent:
+                            entry = reviewer_stats_30_days[reviewer]
+                            entry.setdefault('avatar_url', user['avatar_url'])
+                            entry.setdefault('profile_url', user['html_url'])
 
                 # Count each unique reviewer once per PR
                 for reviewer in reviewers_in_pr:
@@ -677,9 +1390,10 @@ class StatsGenerator:
                     if is_recent:
                         reviewer_stats_30_days[reviewer]['reviews'] += 1
 
-        # Sort and get top 5 for all time
-        top_all_time = sorted(
-            [
+        # Top 5 for all time (nlargest keeps ties in insertion order, like a stable sort)
+        top_all_time = heapq.nlargest(
+            5,
+            (
                 {
                     'login': login,
                     'review_count': stats['reviews'],
@@ -687,14 +1401,14 @@ class StatsGenerator:
                     'profile_url': stats['profile_url']
                 }
                 for login, stats in reviewer_stats_all_time.items()
-            ],
-            key=lambda x: x['review_count'],
-            reverse=True
-        )[:5]
+            ),
+            key=itemgetter('review_count')
+        )
 
-        # Sort and get top 5 for last 30 days
-        top_30_days = sorted(
-            [
+        # Top 5 for last 30 days
+        top_30_days = heapq.nlargest(
+            5,
+            (
                 {
                     'login': login,
                     'review_count': stats['reviews'],
@@ -703,13 +1417,12 @@ class StatsGenerator:
                 }
                 for login, stats in reviewer_stats_30_days.items()
                 if stats['reviews'] > 0  # Only include reviewers with reviews in last 30 days
-            ],
-            key=lambda x: x['review_count'],
-            reverse=True
-        )[:5]
+            ),
+            key=itemgetter('review_count')
+        )
 
-        # Save updated cache
-        if cache_misses > 0:
+        # Save reviews that came embedded in the PR data
+        if unsaved:
             self.save_review_cache(review_cache)
 
         print(f"    - Review data: {cache_hits} from cache, {cache_misses} from API")
@@ -719,14 +1432,65 @@ class StatsGenerator:
             'last_30_days': top_30_days
         }
 
-    def generate_statistics(self) -> Dict[str, Any]:
-        """Generate all statistics for the dashboard.
+    def _repo_state_key(self) -> Optional[str]:
+        """Identify the state of the templates repository and of this script.
+
+        Covers HEAD and every ref (the history is read from all of them) plus
+        the script itself, whose output format may change between versions.
 
         Returns:
-            Complete statistics dictionary
+            Hex digest, or None if the state cannot be identified (git failed
+            or template files have uncommitted changes)
         """
-        print("Generating Domain Connect Templates statistics...")
+        try:
+            refs = subprocess.run(
+                ["git", "show-ref", "--head"],
+                cwd=self.repo_path, capture_output=True, check=True
+            ).stdout
+            changes = subprocess.run(
+                ["git", "status", "--porcelain", "--untracked-files=all", "--", ":(glob)*.json"],
+                cwd=self.repo_path, capture_output=True, check=True
+            ).stdout
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+        # Working tree edits are not reflected in the refs
+        if changes.strip():
+            return None
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(Path(__file__).read_bytes())
+        digest.update(refs)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _build_provider_meta(templates: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Map each providerId to the name and logo of its first template.
+
+        Args:
+            templates: Template metadata in file order
+
+        Returns:
+            Dictionary mapping provider ID to {'name', 'logo_url'}
+        """
+        provider_meta = {}
+        for t in templates:
+            provider_id = t['provider_id']
+            if provider_id and provider_id not in provider_meta:
+                provider_meta[provider_id] = {
+                    'name': t['provider_name'] or provider_id,
+                    'logo_url': t['logo_url']
+                }
+        return provider_meta
+
+    def _parse_templates(self) -> Dict[str, Any]:
+        """Parse all templates and tally their providers, record types and features.
 
+        Returns:
+            Dictionary with 'templates' (metadata list) and the
+            'provider_template_count', 'record_type_distribution',
+            'feature_counts' and 'total_records' tallies
+        """
         # Get template files
         print("  - Scanning template files...")
         template_files = self.get_template_files()
@@ -734,107 +1498,169 @@ class StatsGenerator:
         # Parse all templates
         print("  - Parsing templates...")
         templates = []
-        providers = set()
-        record_type_distribution = defaultdict(int)
-        provider_template_count = defaultdict(int)
-        provider_meta = {}  # provider_id -> {name, logo_url}
+        record_type_distribution = Counter()
+        provider_template_count = Counter()
         total_records = 0
-        feature_counts = {
-            'syncPubKeyDomain': 0,
-            'syncRedirectDomain': 0,
-            'warnPhishing': 0,
-            'hostRequired': 0,
+        feature_counts = Counter()  # Unused features read as 0
+
+        # Parsing is CPU-bound, so large sets are spread over worker processes;
+        # the per-template summaries are merged here either way
+        paths = [str(p) for p in template_files]
+        if len(paths) < _PARALLEL_PARSE_MIN_TEMPLATES or (os.cpu_count() or 1) < 2:
+            results = map(_parse_one, paths)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor()
+            results = executor.map(_parse_one, paths, chunksize=16)
+
+        try:
+            for parsed in results:
+                if parsed is None:
+                    continue
+                meta, record_types, features = parsed
+                templates.append(meta)
+
+                if meta['provider_id']:
+                    provider_template_count[meta['provider_id']] += 1
+
+                record_type_distribution.update(record_types)
+
+                total_records += meta['record_count']
+
+                feature_counts.update(features)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return {
+            'templates': templates,
+            'provider_template_count': provider_template_count,
+            'record_type_distribution': record_type_distribution,
+            'feature_counts': feature_counts,
+            'total_records': total_records,
         }
 
-        for file_path in template_files:
-            template = self.parse_template(file_path)
-            if template:
-                templates.append({
-                    'filename': file_path.name,
-                    'provider_id': template.get('providerId'),
-                    'service_id': template.get('serviceId'),
-                    'provider_name': template.get('providerName'),
-                    'service_name': template.get('serviceName'),
-                    'logo_url': template.get('logoUrl'),
-                    'record_count': len(template.get('records', []))
-                })
-
-                provider_id = template.get('providerId')
-                if provider_id:
-                    providers.add(provider_id)
-                    provider_template_count[provider_id] += 1
-                    # Keep first encountered name/logo for each provider
-                    if provider_id not in provider_meta:
-                        provider_meta[provider_id] = {
-                            'name': template.get('providerName', provider_id),
-                            'logo_url': template.get('logoUrl')
-                        }
-
-                # Count record types (unique per template)
-                record_types = self.get_record_types(template)
-                for record_type in record_types:
-                    record_type_distribution[record_type] += 1
-
-                total_records += len(template.get('records', []))
-
-                # Feature usage
-                if template.get('syncPubKeyDomain'):
-                    feature_counts['syncPubKeyDomain'] += 1
-                if template.get('syncRedirectDomain'):
-                    feature_counts['syncRedirectDomain'] += 1
-                if template.get('warnPhishing') is True:
-                    feature_counts['warnPhishing'] += 1
-                if template.get('hostRequired') is True:
-                    feature_counts['hostRequired'] += 1
+    def _analyze_templates(self, parsed: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute the statistics derived from template files and git history.
+
+        Args:
+            parsed: Result of _parse_templates()
+
+        Returns:
+            Dictionary with the template list and the template, provider,
+            record type and feature sections of the statistics
+        """
+        templates = parsed['templates']
+        provider_template_count = parsed['provider_template_count']
+        feature_counts = parsed['feature_counts']
+        total_records = parsed['total_records']
+        provider_meta = self._build_provider_meta(templates)
 
         # Git history analysis
         print("  - Analyzing git history...")
         commits = self.get_git_history()
-        growth_data = self.calculate_monthly_growth(commits)
-        provider_growth_data = self.calculate_provider_growth(commits, templates)
+        template_first_seen = self._compute_template_first_seen(commits)
+        growth_data = self.calculate_monthly_growth(template_first_seen)
+        provider_growth_data = self.calculate_provider_growth(template_first_seen, templates)
 
-        # Pull request data - fetch once and reuse
-        print("  - Fetching pull request data...")
-        all_prs = self.fetch_all_prs_once()
-        recent_prs = self.get_pull_requests(all_prs)
-        pr_activity = self.calculate_pr_activity(all_prs)
+        # Top providers
+        top_providers = heapq.nlargest(20, provider_template_count.items(), key=itemgetter(1))
 
-        # Contributor data
-        print("  - Fetching contributor data...")
-        contributors = self.get_contributors()
+        return {
+            'templates': templates,
+            'total_providers': len(provider_template_count),
+            'avg_records_per_template': round(total_records / len(templates), 2) if templates else 0,
+            'templates_growth': growth_data['monthly'],
+            'providers_growth': provider_growth_data,
+            'record_types': [
+                {'type': rec_type, 'count': count}
+                for rec_type, count in parsed['record_type_distribution'].most_common()
+            ],
+            'top_providers': [_provider_entry(provider_meta, provider, count)
+                              for provider, count in top_providers],
+            'feature_usage': {
+                'total_templates': len(templates),
+                'features': [
+                    {'name': feature, 'label': feature, 'count': feature_counts[feature]}
+                    for feature in _FEATURE_KEYS
+                ]
+            },
+        }
 
-        # Top reviewers
-        print("  - Fetching top reviewers...")
-        top_reviewers = self.get_top_reviewers(all_prs)
+    def generate_statistics(self) -> Dict[str, Any]:
+        """Generate all statistics for the dashboard.
 
-        # Top providers
-        sorted_providers = sorted(
-            provider_template_count.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        Returns:
+            Complete statistics dictionary
+        """
+        print("Generating Domain Connect Templates statistics...")
 
-        # Last 30 days providers (use providerId from template content)
-        thirty_days_ago = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-        filename_to_provider = {t['filename']: t['provider_id'] for t in templates if t.get('provider_id')}
-        recent_providers = defaultdict(int)
+        # Single reference time, so the generation stamp and the 30-day
+        # windows agree with each other
+        now = datetime.now(timezone.utc)
+
+        # The template and git history sections only depend on the templates
+        # repository, so they are carried over when it has not changed
+        previous_stats = self.load_previous_statistics()
+        cache_key = self._repo_state_key()
+        reuse_templates = (cache_key and previous_stats and previous_stats.get('_cache_key') == cache_key
+                           and isinstance(previous_stats.get('templates'), list))
+
+        # Parse before any thread is started: forking the process pool while
+        # other threads hold locks could deadlock the workers
+        parsed = None if reuse_templates else self._parse_templates()
+
+        # The GitHub API sections are network-bound and independent of the
+        # local analysis, so they run on threads while git history is read
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            print("  - Fetching pull request data, contributors and top reviewers...")
+            prs_future = executor.submit(self.fetch_all_prs_once)
+            contributors_future = executor.submit(self.get_contributors, previous_stats)
+            reviewers_future = executor.submit(
+                lambda: self.get_top_reviewers(prs_future.result(), now)
+            )
 
-        for commit in commits:
-            if commit['date'] >= thirty_days_ago:
-                for file in commit['files']:
-                    provider_id = filename_to_provider.get(file)
-                    if provider_id:
-                        recent_providers[provider_id] += 1
-
-        sorted_recent_providers = sorted(
-            recent_providers.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+            if reuse_templates:
+                print("  - Templates repository unchanged since last run, reusing template statistics")
+                template_stats = {
+                    'templates': previous_stats['templates'],
+                    'total_providers': previous_stats['summary']['total_providers'],
+                    'avg_records_per_template': previous_stats['summary']['avg_records_per_template'],
+                    'templates_growth': previous_stats['templates_growth'],
+                    'providers_growth': previous_stats['providers_growth'],
+                    'record_types': previous_stats['record_types'],
+                    'top_providers': previous_stats['top_providers']['all_time'],
+                    'feature_usage': previous_stats['feature_usage'],
+                }
+            else:
+                template_stats = self._analyze_templates(parsed)
+            templates = template_stats['templates']
+            provider_meta = self._build_provider_meta(templates)
+
+            # Last 30 days providers (use providerId from template content)
+            filename_to_provider = {t['filename']: t['provider_id'] for t in templates if t.get('provider_id')}
+            recent_providers = Counter(
+                filename_to_provider[file]
+                for commit in self._get_recent_commits(30)
+                for file in commit['files']
+                if file in filename_to_provider
+            )
+            # most_common() selects with a heap and keeps ties in insertion order
+            top_recent_providers = recent_providers.most_common(20)
+
+            # Pull request data - fetched once and reused
+            all_prs = prs_future.result()
+            logo_by_filename = {t['filename']: t['logo_url'] for t in templates}
+            recent_prs = self.get_pull_requests(all_prs, logo_by_filename)
+            pr_activity = self.calculate_pr_activity(all_prs)
+
+            contributors, total_contributors = contributors_future.result()
+            top_reviewers = reviewers_future.result()
 
         # Compile statistics
         stats = {
-            'generated_at': datetime.now().isoformat(),
+            # Formatted by the JSON encoder when the file is written
+            'generated_at': now,
             'repository': {
                 'owner': self.repo_owner,
                 'name': self.repo_name,
@@ -842,57 +1668,31 @@ class StatsGenerator:
             },
             'summary': {
                 'total_templates': len(templates),
-                'total_providers': len(providers),
+                'total_providers': template_stats['total_providers'],
                 'total_merged_prs': pr_activity['total_merged'],
                 'total_open_prs': pr_activity['total_open'],
-                'total_contributors': len(contributors),
-                'avg_records_per_template': round(total_records / len(templates), 2) if templates else 0
+                'total_contributors': total_contributors,
+                'avg_records_per_template': template_stats['avg_records_per_template']
             },
-            'templates_growth': growth_data['monthly'],
-            'providers_growth': provider_growth_data,
+            'templates_growth': template_stats['templates_growth'],
+            'providers_growth': template_stats['providers_growth'],
             'pr_activity': pr_activity['monthly'],
-            'record_types': [
-                {'type': rec_type, 'count': count}
-                for rec_type, count in sorted(
-                    record_type_distribution.items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                )
-            ],
+            'record_types': template_stats['record_types'],
             'top_providers': {
-                'all_time': [
-                    {
-                        'provider_id': provider,
-                        'provider_name': provider_meta.get(provider, {}).get('name', provider),
-                        'logo_url': provider_meta.get(provider, {}).get('logo_url'),
-                        'template_count': count
-                    }
-                    for provider, count in sorted_providers[:20]
-                ],
-                'last_30_days': [
-                    {
-                        'provider_id': provider,
-                        'provider_name': provider_meta.get(provider, {}).get('name', provider),
-                        'logo_url': provider_meta.get(provider, {}).get('logo_url'),
-                        'template_count': count
-                    }
-                    for provider, count in sorted_recent_providers[:20]
-                ]
-            },
-            'feature_usage': {
-                'total_templates': len(templates),
-                'features': [
-                    {'name': 'syncPubKeyDomain', 'label': 'syncPubKeyDomain', 'count': feature_counts['syncPubKeyDomain']},
-                    {'name': 'syncRedirectDomain', 'label': 'syncRedirectDomain', 'count': feature_counts['syncRedirectDomain']},
-                    {'name': 'warnPhishing', 'label': 'warnPhishing', 'count': feature_counts['warnPhishing']},
-                    {'name': 'hostRequired', 'label': 'hostRequired', 'count': feature_counts['hostRequired']},
-                ]
+                'all_time': template_stats['top_providers'],
+                'last_30_days': [_provider_entry(provider_meta, provider, count)
+                                 for provider, count in top_recent_providers]
             },
+            'feature_usage': template_stats['feature_usage'],
             'recent_prs': recent_prs,
             'top_reviewers': top_reviewers,
             'templates': templates,
             'contributors': contributors[:50]  # Top 50 contributors
         }
+        if cache_key:
+            stats['_cache_key'] = cache_key
+        if self.contributors_complete:
+            stats['_contributors_complete'] = True
 
         print(f"  - Statistics generated successfully!")
         print(f"    Total templates: {stats['summary']['total_templates']}")
@@ -901,20 +1701,67 @@ class StatsGenerator:
 
         return stats
 
-    def save_statistics(self, stats: Dict[str, Any], output_path: str = "docs/stats.json"):
+    def load_previous_statistics(self, path: str = "docs/stats.json") -> Optional[Dict[str, Any]]:
+        """Load statistics written by a previous run.
+
+        A templates reference left by --split-templates is resolved from the
+        file it points to, so the templates can be reused either way.
+
+        Args:
+            path: Path of the previous stats.json
+
+        Returns:
+            Previous statistics dictionary or None if unavailable
+        """
+        try:
+            stats = _load_json_file(Path(path))
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+            return None
+
+        templates = stats.get('templates') if isinstance(stats, dict) else None
+        if isinstance(templates, dict) and '$ref' in templates:
+            try:
+                stats['templates'] = _load_json_file(Path(path).with_name(templates['$ref']))
+            except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+                pass
+        return stats
+
+    def save_statistics(self, stats: Dict[str, Any], output_path: str = "docs/stats.json",
+                        pretty: bool = False, split_templates: bool = False):
         """Save statistics to JSON file.
 
+        Output is compact by default, since the file is read by the dashboard
+        rather than by people.
+
         Args:
             stats: Statistics dictionary
             output_path: Output file path
+            pretty: Indent the JSON output for human inspection
+            split_templates: Write the per-template list to templates.json next
+                to the output file, leaving a reference in its place; without it
+                a templates.json from an earlier split run is removed
         """
         output_file = Path(output_path).resolve()
         output_file.parent.mkdir(parents=True, exist_ok=True)
+        templates_file = output_file.with_name("templates.json")
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
+        if split_templates:
+            if _write_if_changed(templates_file, _dump_json(stats['templates'], pretty=pretty)):
+                print(f"  - Templates saved to {templates_file.name}")
+            else:
+                print(f"  - Templates unchanged, kept {templates_file.name}")
+            stats = {**stats, 'templates': {'$ref': templates_file.name, 'count': len(stats['templates'])}}
 
-        print(f"  - Statistics saved to {output_path}")
+        if _write_if_changed(output_file, _dump_json(stats, pretty=pretty)):
+            print(f"  - Statistics saved to {output_path}")
+        else:
+            print(f"  - Statistics unchanged, kept {output_path}")
+
+        # A templates.json left by an earlier split run would go stale next
+        # to inline templates
+        if not split_templates and templates_file.exists():
+            templates_file.unlink()
+            print(f"  - Removed stale {templates_file.name}")
 
 
 def main():
@@ -927,6 +1774,12 @@ def main():
     parser.add_argument("--repo-owner", help="GitHub repository owner (e.g. 'Domain-Connect')")
     parser.add_argument("--repo-name", help="GitHub repository name (e.g. 'Templates')")
     parser.add_argument("--remote", help="Git remote name to use for auto-detection (e.g. 'upstream')")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Write indented stats.json for human inspection (default: compact)")
+    parser.add_argument("--split-templates", action="store_true",
+                        help="Write the per-template list to docs/templates.json instead of embedding it")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Log debug output (pagination and reviewer progress)")
     args = parser.parse_args()
 
     if bool(args.repo_owner) != bool(args.repo_name):
@@ -935,6 +1788,11 @@ def main():
     if args.remote and (args.repo_owner or args.repo_name):
         parser.error("--remote cannot be used together with --repo-owner/--repo-name")
 
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.verbose:
+        # Only this script's debug output; urllib3 would log every request
+        logger.setLevel(logging.DEBUG)
+
     # Check for GitHub token
     if not os.environ.get("GITHUB_TOKEN"):
         print("Warning: GITHUB_TOKEN environment variable not set.")
@@ -948,8 +1806,11 @@ def main():
         repo_name=args.repo_name,
         remote=args.remote
     )
-    stats = generator.generate_statistics()
-    generator.save_statistics(stats)
+    try:
+        stats = generator.generate_statistics()
+        generator.save_statistics(stats, pretty=args.pretty, split_templates=args.split_templates)
+    finally:
+        generator.close()
 
     print("\nDone! Open docs/index.html to view statistics.")
 